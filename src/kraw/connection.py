@@ -1,15 +1,32 @@
 import asyncio
+import re
 import time
-from random import randint
+from collections import OrderedDict
+from itertools import islice
 from types import SimpleNamespace
-from typing import Optional, Callable, List, Dict, Union
+from typing import Optional, Callable, List, Dict, Set, Tuple, Union
 
 import aiohttp
+import orjson
 
 from . import dummies
 
 __all__ = ["Connection"]
 
+# Content types accepted as JSON, matching what aiohttp's response.json() accepts.
+JSON_CONTENT_TYPE = re.compile(r"^application/(?:[\w.+-]+?\+)?json")
+# Maximum number of responses kept by the send_request cache.
+CACHE_MAX_ENTRIES: int = 256
+# Kinds of the things found in a post's comments listing.
+COMMENT_KIND: str = "t1"
+MORE_KIND: str = "more"
+# Maximum number of comment IDs Reddit accepts in a single morechildren request.
+MORECHILDREN_BATCH_SIZE: int = 100
+# Maximum number of items Reddit returns in a single listing page.
+LISTING_PAGE_SIZE: int = 100
+# Seconds between repaints of the pagination countdown.
+COUNTDOWN_TICK: float = 0.25
+
 
 class Endpoints:
 
@@ -19,6 +36,7 @@ class Endpoints:
     subreddit: str = f"{base}/r"
     subreddits: str = f"{base}/subreddits"
     username_available: str = f"{base}/api/username_available.json"
+    morechildren: str = f"{base}/api/morechildren.json"
     infra_status: str = "https://www.redditstatus.com/api/v2/status.json"
     infra_components: str = "https://www.redditstatus.com/api/v2/components.json"
 
@@ -27,6 +45,18 @@ class Connection:
     def __init__(self, headers: Dict):
         self._headers = headers
         self.endpoints = Endpoints()
+        # Reddit only allows one morechildren request at a time. Shared across calls,
+        # so concurrent paginations queue up behind each other too. Created lazily, as
+        # a semaphore binds to the event loop it's first used in.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Rate-limit state, as reported by the X-Ratelimit-* headers of the last response.
+        self._ratelimit_remaining: float = 1.0
+        self._ratelimit_reset: float = 1.0
+        # Raw response bodies of requests sent with a cache_ttl, keyed by URL and params,
+        # alongside the (monotonic) time they expire at. Bodies are parsed again on each
+        # hit, so callers never share (and mutate) a cached object.
+        self._cache: OrderedDict[Tuple, Tuple[float, bytes]] = OrderedDict()
 
     async def send_request(
         self,
@@ -35,22 +65,74 @@ class Connection:
         params: Optional[Dict] = None,
         proxy: Optional[str] = None,
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
+        cache_ttl: Optional[float] = None,
     ) -> Union[Dict, List, bool, None]:
 
-        try:
-            async with session.get(
-                url=endpoint,
-                headers=self._headers,
-                params=params,
-                proxy=proxy,
-                proxy_auth=proxy_auth,
-            ) as response:
-                response.raise_for_status()
-                response_data: Union[Dict, List] = await response.json()
-                return response_data
+        if cache_ttl:
+            cache_key = (endpoint, tuple(sorted((params or {}).items())))
+            cached = self._cache.get(cache_key)
+            if cached:
+                if cached[0] > time.monotonic():
+                    return self._parse_body(cached[1])
+
+                # Expired entries are only dropped once they're looked up again.
+                del self._cache[cache_key]
+
+        async with session.get(
+            url=endpoint,
+            headers=self._headers,
+            params=params,
+            proxy=proxy,
+            proxy_auth=proxy_auth,
+        ) as response:
+            response.raise_for_status()
+            # Only Reddit's own responses carry rate-limit headers, leave the state alone
+            # for anything else (e.g. redditstatus.com).
+            if "x-ratelimit-remaining" in response.headers:
+                self._ratelimit_remaining = float(
+                    response.headers["x-ratelimit-remaining"]
+                )
+                self._ratelimit_reset = float(
+                    response.headers.get("x-ratelimit-reset", 1)
+                )
+            # Reject non-JSON responses (e.g. HTML interstitials) the same way
+            # response.json() does, so callers can keep catching aiohttp.ClientError.
+            if not JSON_CONTENT_TYPE.match(response.content_type):
+                raise aiohttp.ContentTypeError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message="Attempt to decode JSON with unexpected mimetype: "
+                    f"{response.content_type}",
+                    headers=response.headers,
+                )
+            response_body: bytes = await response.read()
+
+        response_data: Union[Dict, List, None] = self._parse_body(response_body)
+
+        if cache_ttl:
+            self._cache[cache_key] = (time.monotonic() + cache_ttl, response_body)
+            self._cache.move_to_end(cache_key)
+            # Cap the cache by dropping the oldest stored entries.
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+        return response_data
+
+    @staticmethod
+    def _parse_body(body: bytes) -> Union[Dict, List, None]:
+        """
+        Parse a JSON response body.
 
-        except Exception as error:
-            raise error
+        :param body: The raw response body.
+        :return: The parsed body, or None if it's empty (like aiohttp's response.json()).
+        """
+
+        if not body.strip():
+            return None
+
+        # orjson parses the raw UTF-8 bytes, skipping aiohttp's decode to str.
+        return orjson.loads(body)
 
     async def paginate_response(
         self,
@@ -68,109 +150,221 @@ class Connection:
 
         # Initialise an empty list to store all items across paginated requests.
         all_items: List = []
+        # IDs of the items collected so far, pages can overlap (e.g. when a listing shifts).
+        seen_ids: Set[str] = set()
         # Initialise the ID of the last item fetched to None (used for pagination).
         last_item_id = None
+        # The next page, when it's been requested ahead of time.
+        next_page: Optional[asyncio.Task] = None
+        # Number of items Reddit has listed so far, duplicates included. Sent as the
+        # 'count' of every page request, whether it's prefetched or not.
+        listed_count: int = 0
 
-        # Continue fetching data until the limit is reached or no more items are available.
-        while len(all_items) < limit:
-            # Make an asynchronous request to the endpoint.
-            response = await self.send_request(
-                session=session,
-                endpoint=(
-                    f"{endpoint}?after={last_item_id}&count={len(all_items)}"
-                    if last_item_id
-                    else endpoint
-                ),
-                params=params,
-                proxy=proxy,
-                proxy_auth=proxy_auth,
-            )
-
-            if is_post_comments:
-                semaphore = asyncio.Semaphore(
-                    3
-                )  # Only allow 3 tasks to run concurrently (because API rate limit happens, lol)
-                items = await self._process_post_comments(
-                    session=session,
-                    endpoint=endpoint,
-                    proxy=proxy,
-                    proxy_auth=proxy_auth,
-                    response=parser(response[1]),
-                    parser=parser,
-                    limit=limit,
-                    status=status,
-                    message=message,
-                    semaphore=semaphore,
-                )
-            else:
-
-                # If not handling comments, simply extract the items from the response.
-                items = parser(response=response).children
-
-            # If no items are found, break the loop as there's nothing more to fetch.
-            if not items:
-                break
-
-            # Determine how many more items are needed to reach the limit.
-            items_to_limit = limit - len(all_items)
-
-            # Add the processed items to the all_items list, up to the specified limit.
-            all_items.extend(items[:items_to_limit])
-
-            # Update the last_item_id to the ID of the last fetched item for pagination.
-
-            last_item_id = (
-                parser(response=response[1]).after
-                if is_post_comments
-                else parser(response=response).after
-            )
-
-            # If we've reached the specified limit, break the loop.
-            if len(all_items) == limit:
-                break
-
-            # Introduce a random sleep duration between 1 and 5 seconds to avoid rate-limiting.
-            sleep_duration = randint(1, 5)
-
-            # If a status object is provided, use it to display a countdown timer.
-            if status:
+        try:
+            # Continue fetching data until the limit is reached or no more items are available.
+            while len(all_items) < limit:
+                if next_page:
+                    response = await next_page
+                    next_page = None
+                else:
+                    # Make an asynchronous request to the endpoint.
+                    response = await self._request_page(
+                        session=session,
+                        endpoint=endpoint,
+                        params=params,
+                        after=last_item_id,
+                        count=listed_count,
+                        page_size=(
+                            None
+                            if is_post_comments
+                            else min(limit - len(all_items), LISTING_PAGE_SIZE)
+                        ),
+                        proxy=proxy,
+                        proxy_auth=proxy_auth,
+                    )
+
+                listing_data: Dict = (
+                    response[1] if is_post_comments else response
+                ).get("data", {})
+                page_count = len(listing_data.get("children", []))
+                listed_count += page_count
+
+                # While the rate limit allows it, request the next page in the background,
+                # so it downloads while this one is being parsed.
+                if not is_post_comments and not self._ratelimit_sleep_duration():
+                    next_item_id = listing_data.get("after")
+                    # At most this many items will have been collected after this page.
+                    fetched_count = len(all_items) + page_count
+
+                    if next_item_id and fetched_count < limit:
+                        next_page = asyncio.create_task(
+                            self._request_page(
+                                session=session,
+                                endpoint=endpoint,
+                                params=params,
+                                after=next_item_id,
+                                count=listed_count,
+                                page_size=min(limit - fetched_count, LISTING_PAGE_SIZE),
+                                proxy=proxy,
+                                proxy_auth=proxy_auth,
+                            )
+                        )
+                        # Yield once so the request gets under way before parsing, which
+                        # doesn't await and would otherwise hold it back.
+                        await asyncio.sleep(0)
+
+                # Parse the listing once, both its items and the pagination ID are read from it.
+                listing = parser(response=response[1] if is_post_comments else response)
+
+                if is_post_comments:
+                    items, more_items_ids = self._process_post_comments(
+                        children=listing.children
+                    )
+
+                    # If there are more items to fetch (kind == "more"), make additional requests.
+                    if more_items_ids:
+                        await self._paginate_more_items(
+                            session=session,
+                            link_id=response[0]["data"]["children"][0]["data"]["name"],
+                            proxy=proxy,
+                            proxy_auth=proxy_auth,
+                            message=message,
+                            status=status,
+                            fetched_items=items,
+                            more_items_ids=more_items_ids,
+                            limit=limit,
+                            parser=parser,
+                        )
+                else:
+
+                    # If not handling comments, simply extract the items from the response.
+                    items = listing.children
+
+                # If no items are found, break the loop as there's nothing more to fetch.
+                if not items:
+                    break
+
+                # Determine how many more items are needed to reach the limit.
+                items_to_limit = limit - len(all_items)
+
+                # Add the processed items to the all_items list, up to the specified limit,
+                # dropping items that were already collected from a previous page. Items
+                # are appended directly, rather than through an intermediate copy.
+                for item in items:
+                    if not items_to_limit:
+                        break
+
+                    item_id = self._item_id(item)
+                    if item_id is not None:
+                        if item_id in seen_ids:
+                            continue
+                        seen_ids.add(item_id)
+
+                    all_items.append(item)
+                    items_to_limit -= 1
+
+                # A cursor that didn't move would fetch the same page forever.
+                cursor_stalled = listing.after == last_item_id
+
+                # Update the last_item_id to the ID of the last fetched item for pagination.
+                last_item_id = listing.after
+
+                # If we've reached the specified limit, or there's no next page, break the loop.
+                if len(all_items) == limit or not last_item_id or cursor_stalled:
+                    break
+
+                # The next page is already on its way, and was only requested because
+                # there was no need to back off.
+                if next_page:
+                    continue
+
+                # Only back off when the rate-limit window is (almost) used up.
+                sleep_duration = self._ratelimit_sleep_duration()
+
+                if not sleep_duration:
+                    continue
+
+                # Display a countdown timer if a status object is provided, otherwise just sleep.
                 await self._pagination_countdown_timer(
                     status=status,
                     duration=sleep_duration,
                     current_count=len(all_items),
                     overall_count=limit,
                 )
-            else:
-                # Otherwise, just sleep for the calculated duration.
-                await asyncio.sleep(sleep_duration)
+        finally:
+            # Don't leave a prefetched page running once we're done (or failed).
+            if next_page:
+                next_page.cancel()
 
         # Return the list of all fetched and processed items (without duplicates).
         return all_items
 
+    async def _request_page(
+        self,
+        session: aiohttp.ClientSession,
+        endpoint: str,
+        params: Optional[Dict],
+        after: Optional[str],
+        count: int,
+        page_size: Optional[int] = None,
+        proxy: Optional[str] = None,
+        proxy_auth: Optional[aiohttp.BasicAuth] = None,
+    ) -> Union[Dict, List]:
+        """
+        Request a single page of a listing.
+
+        :param session: The aiohttp session used for making requests.
+        :param endpoint: The API endpoint of the listing.
+        :param params: The caller's query params, which are left untouched.
+        :param after: ID of the last item on the previous page, None for the first page.
+        :param count: Number of items fetched before this page.
+        :param page_size: Optional number of items to ask for, overriding params["limit"].
+        :param proxy: Optional proxy URL for the request.
+        :param proxy_auth: Optional proxy authentication.
+        :return: The raw response of the page.
+        """
+
+        page_params: Dict = dict(params or {})
+
+        if after:
+            page_params["after"] = after
+            page_params["count"] = count
+
+        # Only ask for as many items as are still needed, so the tail page isn't
+        # downloaded and parsed in full just to be truncated.
+        if page_size:
+            page_params["limit"] = page_size
+
+        return await self.send_request(
+            session=session,
+            endpoint=endpoint,
+            params=page_params,
+            proxy=proxy,
+            proxy_auth=proxy_auth,
+        )
+
     async def _paginate_more_items(
         self,
         session: aiohttp.ClientSession,
         more_items_ids: List[str],
-        endpoint: str,
+        link_id: str,
         parser: Callable,
         fetched_items: List[Dict],
         limit: int,
-        semaphore: asyncio.Semaphore,
         status: Optional[dummies.Status] = None,
         proxy: Optional[str] = None,
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
         message: Optional[dummies.Message] = None,
     ):
         """
-        Fetch additional items (comments) and paginate them concurrently while respecting the given limit.
+        Fetch additional items (comments) in batches, one batch at a time, while respecting the given limit.
 
         :param session: The aiohttp session used for making requests.
         :param more_items_ids: List of additional item IDs to fetch.
-        :param endpoint: The API endpoint to fetch the items.
+        :param link_id: Fullname (t3_*) of the post the additional items belong to.
         :param parser: A callable used to parse the response.
         :param fetched_items: List of already fetched items.
         :param limit: The maximum number of items to fetch.
-        :param semaphore: A semaphore limiting the number of concurrent tasks.
         :param status: Optional status object for displaying progress.
         :param proxy: Optional proxy URL for the request.
         :param proxy_auth: Optional proxy authentication.
@@ -182,142 +376,219 @@ class Connection:
         if remaining_items <= 0:
             return  # Stop if we've already hit the limit
 
-        message.ok(f"Found {len(more_items_ids)} additional comments")
-
-        # Create a list to hold all the asynchronous tasks
-        tasks = []
+        if message:
+            message.ok(f"Found {len(more_items_ids)} additional comments")
 
+        # Every ID that has been queued, so the same IDs are never requested twice
+        # (a "more" item pointing back at them would otherwise loop forever).
+        queued_ids: Set[str] = set()
+        pending_ids: List[str] = []
         for more_id in more_items_ids:
-            if len(fetched_items) >= limit:
-                break  # Stop if we've already fetched enough items
-
-            # Each task will fetch and process one additional item
-            tasks.append(
-                self._fetch_and_process_item(
-                    session=session,
-                    more_id=more_id,
-                    endpoint=endpoint,
-                    parser=parser,
-                    fetched_items=fetched_items,
-                    overall_items_limit=limit,  # Fixed this typo
-                    semaphore=semaphore,
-                    status=status,
-                    proxy=proxy,
-                    proxy_auth=proxy_auth,
-                )
+            if more_id not in queued_ids:
+                queued_ids.add(more_id)
+                pending_ids.append(more_id)
+
+        # "more" items returned by a batch are re-queued until there's nothing left to fetch.
+        while pending_ids and len(fetched_items) < limit:
+            batch_ids = pending_ids[:MORECHILDREN_BATCH_SIZE]
+            pending_ids = pending_ids[MORECHILDREN_BATCH_SIZE:]
+
+            # Batches are sent one after another, as Reddit rejects concurrent
+            # morechildren requests.
+            requeued_ids = await self._fetch_and_process_item(
+                session=session,
+                more_ids=batch_ids,
+                link_id=link_id,
+                parser=parser,
+                fetched_items=fetched_items,
+                overall_items_limit=limit,
+                status=status,
+                proxy=proxy,
+                proxy_auth=proxy_auth,
             )
 
-        # Run all tasks concurrently, respecting the semaphore
-        await asyncio.gather(*tasks)
+            for more_id in requeued_ids:
+                if more_id not in queued_ids:
+                    queued_ids.add(more_id)
+                    pending_ids.append(more_id)
 
     async def _fetch_and_process_item(
         self,
         session: aiohttp.ClientSession,
-        more_id: str,
-        endpoint: str,
+        more_ids: List[str],
+        link_id: str,
         parser: Callable,
         fetched_items: List[Dict],
         overall_items_limit: int,
-        semaphore: asyncio.Semaphore,
         status: Optional[dummies.Status] = None,
         proxy: Optional[str] = None,
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
-    ):
+    ) -> List[str]:
         """
-        Fetch and process a single item (comment) from the API, limited by the semaphore.
+        Fetch and process a batch of items (comments) from the API, limited by the shared semaphore.
 
         :param session: The aiohttp session used for making requests.
-        :param more_id: The ID of the additional item to fetch.
-        :param endpoint: The API endpoint to fetch the item.
+        :param more_ids: IDs of the additional items to fetch in a single request.
+        :param link_id: Fullname (t3_*) of the post the additional items belong to.
         :param parser: A callable used to parse the response.
         :param fetched_items: List of already fetched items.
         :param overall_items_limit: The overall number of items needed.
-        :param semaphore: A semaphore limiting the number of concurrent tasks.
         :param status: Optional status object for displaying progress.
         :param proxy: Optional proxy URL for the request.
         :param proxy_auth: Optional proxy authentication.
+        :return: IDs from nested "more" items, which still need to be fetched.
         """
 
-        async with semaphore:  # Limit the number of concurrent tasks
+        # Only one morechildren request at a time
+        async with self._more_items_semaphore():
             # Check if we've already reached the overall limit
             if len(fetched_items) >= overall_items_limit:
-                return
-
-            # Construct the endpoint for each additional comment ID
-            more_endpoint = f"{endpoint}?comment={more_id}"
+                return []
 
-            # Make an asynchronous request to fetch the additional comments
+            # Make an asynchronous request to fetch the whole batch of additional comments
             more_response = await self.send_request(
                 session=session,
-                endpoint=more_endpoint,
+                endpoint=self.endpoints.morechildren,
+                params={
+                    "api_type": "json",
+                    "link_id": link_id,
+                    "children": ",".join(more_ids),
+                    "raw_json": 1,
+                },
                 proxy=proxy,
                 proxy_auth=proxy_auth,
             )
 
-            # Extract the items (comments) from the response
-            more_items = parser(response=more_response[1])
+            # The endpoint returns a flat list of things, wrap it as a listing for the parser.
+            things = more_response.get("json", {}).get("data", {}).get("things", [])
+            more_items = parser(
+                response={
+                    "kind": "Listing",
+                    "data": {"children": things, "after": None},
+                }
+            )
+
+            items, requeued_ids = self._process_post_comments(
+                children=more_items.children
+            )
 
             # Determine how many more items we can add without exceeding the limit
-            items_to_add = min(
-                overall_items_limit - len(fetched_items), len(more_items.children)
-            )
+            items_to_add = min(overall_items_limit - len(fetched_items), len(items))
 
-            # Add the allowed number of items to the main items list
-            fetched_items.extend(more_items.children[:items_to_add])
+            # Add the allowed number of items to the main items list, without copying a slice
+            fetched_items.extend(islice(items, items_to_add))
 
             # If we've reached the overall limit, stop further processing
             if len(fetched_items) >= overall_items_limit:
-                return
-
-            # Introduce a random sleep duration to avoid rate-limiting
-            sleep_duration = randint(1, 5)
-            await self._pagination_countdown_timer(
-                duration=sleep_duration,
-                overall_count=overall_items_limit,
-                current_count=len(fetched_items),
-                status=status,
-            )
+                return []
+
+            # Back off only when the rate-limit window is (almost) used up
+            sleep_duration = self._ratelimit_sleep_duration()
+            if sleep_duration:
+                await self._pagination_countdown_timer(
+                    duration=sleep_duration,
+                    overall_count=overall_items_limit,
+                    current_count=len(fetched_items),
+                    status=status,
+                )
+
+            return requeued_ids
+
+    @staticmethod
+    def _process_post_comments(
+        children: List[SimpleNamespace],
+    ) -> Tuple[List[SimpleNamespace], List[str]]:
+        """
+        Split the children of a parsed comments listing into comments and "more" item IDs.
+
+        :param children: Children of a parsed comments listing.
+        :return: A tuple of the comments, and the IDs of additional comments still to be fetched.
+        """
 
-    async def _process_post_comments(self, **kwargs):
-        # If the request is for post comments, handle the response accordingly.
         items = []  # Initialise a list to store fetched items.
         more_items_ids = []  # Initialise a list to store IDs from "more" items.
 
-        # Iterate over the children in the response to extract comments or "more" items.
-        for item in kwargs.get("response").children:
-            if item.kind == "t1":
+        # Bind the list methods locally, this loop runs once for every comment in a post.
+        add_item = items.append
+        add_more_items_ids = more_items_ids.extend
+
+        # Iterate over the children to extract comments or "more" items,
+        # reading each item's kind only once.
+        for item in children:
+            kind = item.kind
+            if kind == COMMENT_KIND:
                 # If the item is a comment (kind == "t1"), add it to the items list.
-                items.append(item)
-            elif item.kind == "more":
+                add_item(item)
+            elif kind == MORE_KIND:
                 # If the item is of kind "more", extract the IDs for additional comments.
-                more_items_ids.extend(item.data.children)
-
-        # If there are more items to fetch (kind == "more"), make additional requests.
-        if more_items_ids:
-            await self._paginate_more_items(
-                session=kwargs.get("session"),
-                proxy=kwargs.get("proxy"),
-                proxy_auth=kwargs.get("proxy_auth"),
-                message=kwargs.get("message"),
-                status=kwargs.get("status"),
-                fetched_items=items,
-                more_items_ids=more_items_ids,
-                endpoint=kwargs.get("endpoint"),
-                limit=kwargs.get("limit"),
-                parser=kwargs.get("parser"),
-                semaphore=kwargs.get("semaphore"),
-            )
+                add_more_items_ids(item.data.children)
+
+        return items, more_items_ids
+
+    def _more_items_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting morechildren requests, for the running event loop.
+
+        :return: The semaphore, (re)created if this is the first call in the running loop,
+            so a Connection can be reused across separate asyncio.run() calls.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(1)
+            self._semaphore_loop = loop
+
+        return self._semaphore
+
+    @staticmethod
+    def _item_id(item: SimpleNamespace) -> Optional[str]:
+        """
+        Get the ID of a parsed item, whether it's flat or wrapped in a kind/data pair.
+
+        :param item: A parsed item from a listing.
+        :return: The item's ID, or None if it doesn't have one.
+        """
+
+        item_id = getattr(item, "id", None)
+        if item_id is None:
+            item_id = getattr(getattr(item, "data", None), "id", None)
+
+        return item_id
+
+    def _ratelimit_sleep_duration(self) -> float:
+        """
+        Get the number of seconds to wait before the next request, based on the
+        X-Ratelimit-* headers of the last response.
+
+        :return: 0 while requests remain in the current window, otherwise the time
+            until the window resets, spread over the remaining requests.
+        """
 
-        return items
+        if self._ratelimit_remaining > 1:
+            return 0
+
+        return self._ratelimit_reset / max(self._ratelimit_remaining, 1)
 
     @staticmethod
     async def _pagination_countdown_timer(
-        duration: int,
+        duration: float,
         current_count: int,
         overall_count: int,
         status: Optional[dummies.Status] = None,
     ):
 
+        # Without a status to repaint, there's nothing to count down.
+        if not status:
+            await asyncio.sleep(duration)
+            return
+
+        # The counts don't change during the countdown, so only the remaining time is
+        # formatted on each tick.
+        countdown_template: str = (
+            f"Gotten [cyan]{current_count}[/] of [cyan]{overall_count}[/] items so far. "
+            "Resuming in [cyan]{seconds}.{milliseconds:02}[/] seconds"
+        )
+
         end_time: float = time.time() + duration
         while time.time() < end_time:
             remaining_time: float = end_time - time.time()
@@ -326,17 +597,13 @@ class Connection:
                 (remaining_time - remaining_seconds) * 100
             )
 
-            countdown_text: str = (
-                f"Gotten [cyan]{current_count}[/] of [cyan]{overall_count}[/] items so far. "
-                f"Resuming in [cyan]{remaining_seconds}.{remaining_milliseconds:02}[/] seconds"
-            )
-
-            (
-                status.update(countdown_text)
-                if status
-                else print(countdown_text.strip("[,],/,cyan"))
+            status.update(
+                countdown_template.format(
+                    seconds=remaining_seconds, milliseconds=remaining_milliseconds
+                )
             )
-            await asyncio.sleep(0.01)  # Sleep for 10 milliseconds
+            # Repaint 4 times a second, which is plenty for a human-readable countdown.
+            await asyncio.sleep(min(COUNTDOWN_TICK, remaining_time))
 
 
 # -------------------------------- END ----------------------------------------- #
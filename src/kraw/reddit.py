@@ -3,12 +3,53 @@ from typing import Literal, Union, Optional, List, Dict
 
 import aiohttp
 import karmakaze
+import orjson
 
 from . import dummies
 
 __all__ = ["Reddit"]
 
-from .connection import Connection
+from .connection import Connection, Endpoints
+
+# How long (in seconds) to reuse responses that rarely change between calls.
+_INFRA_STATUS_CACHE_TTL: float = 30
+_ABOUT_CACHE_TTL: float = 300
+
+
+# Endpoint templates per kind, built once at import and formatted per call.
+_COMMENTS_ENDPOINTS: Dict[str, str] = {
+    "user_overview": f"{Endpoints.user}/{{username}}/overview.json",
+    "user": f"{Endpoints.user}/{{username}}/comments.json",
+    "post": f"{Endpoints.subreddit}/{{subreddit}}/comments/{{id}}.json",
+}
+_POSTS_ENDPOINTS: Dict[str, str] = {
+    "best": f"{Endpoints.base}/r/best.json",
+    "controversial": f"{Endpoints.base}/r/controversial.json",
+    "front_page": f"{Endpoints.base}/.json",
+    "new": f"{Endpoints.base}/new.json",
+    "popular": f"{Endpoints.base}/r/popular.json",
+    "rising": f"{Endpoints.base}/r/rising.json",
+    "subreddit": f"{Endpoints.subreddit}/{{subreddit}}.json",
+    "user": f"{Endpoints.user}/{{username}}/submitted.json",
+    "search_subreddit": f"{Endpoints.subreddit}/{{subreddit}}/search.json",
+}
+_SEARCH_ENDPOINTS: Dict[str, str] = {
+    "posts": f"{Endpoints.base}/search.json",
+    "subreddits": f"{Endpoints.subreddits}/search.json",
+    "users": f"{Endpoints.users}/search.json",
+}
+_SUBREDDITS_ENDPOINTS: Dict[str, str] = {
+    "all": f"{Endpoints.subreddits}.json",
+    "default": f"{Endpoints.subreddits}/default.json",
+    "new": f"{Endpoints.subreddits}/new.json",
+    "popular": f"{Endpoints.subreddits}/popular.json",
+    "user_moderated": f"{Endpoints.user}/{{username}}/moderated_subreddits.json",
+}
+_USERS_ENDPOINTS: Dict[str, str] = {
+    "all": f"{Endpoints.users}.json",
+    "new": f"{Endpoints.users}/new.json",
+    "popular": f"{Endpoints.users}/popular.json",
+}
 
 
 class Reddit:
@@ -37,6 +78,26 @@ class Reddit:
         self._parse = karmakaze.SanitiseAndParse()
         self.connection = Connection(headers=headers)
 
+    @staticmethod
+    def make_session(limit: int = 20) -> aiohttp.ClientSession:
+        """
+        Create a ClientSession tuned for repeated requests to Reddit, so DNS lookups
+        and TLS connections are reused across calls. Must be called from a coroutine.
+
+        :param limit: The maximum number of simultaneous connections.
+        :return: A new ClientSession, which the caller is responsible for closing.
+        """
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=limit,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        )
+
     async def infra_status(
         self,
         session: aiohttp.ClientSession,
@@ -54,6 +115,7 @@ class Reddit:
             endpoint=self.connection.endpoints.infra_status,
             proxy=proxy,
             proxy_auth=proxy_auth,
+            cache_ttl=_INFRA_STATUS_CACHE_TTL,
         )
 
         indicator = status_response.get("status").get("indicator")
@@ -63,11 +125,10 @@ class Reddit:
 
                 message.ok(description) if message else print(description)
             else:
-                status_message = f"{description} ([yellow]{indicator}[/])"
                 (
-                    message.warning(status_message)
+                    message.warning(f"{description} ([yellow]{indicator}[/])")
                     if message
-                    else print(status_message.strip("[,],/,yellow"))
+                    else print(f"{description} ({indicator})")
                 )
 
                 if status:
@@ -76,6 +137,7 @@ class Reddit:
                 status_components: Dict = await self.connection.send_request(
                     session=session,
                     endpoint=self.connection.endpoints.infra_components,
+                    cache_ttl=_INFRA_STATUS_CACHE_TTL,
                 )
 
                 if isinstance(status_components, Dict):
@@ -97,17 +159,14 @@ class Reddit:
         **kwargs: str,
     ) -> List[SimpleNamespace]:
 
-        comments_map = {
-            "user_overview": f"{self.connection.endpoints.user}/{kwargs.get('username')}/overview.json",
-            "user": f"{self.connection.endpoints.user}/{kwargs.get('username')}/comments.json",
-            "post": f"{self.connection.endpoints.subreddit}/{kwargs.get('subreddit')}"
-            f"/comments/{kwargs.get('id')}.json",
-        }
-
         if status:
             status.update(f"Getting {limit} comments from {kind}")
 
-        endpoint = comments_map[kind]
+        endpoint = _COMMENTS_ENDPOINTS[kind].format(
+            username=kwargs.get("username"),
+            subreddit=kwargs.get("subreddit"),
+            id=kwargs.get("id"),
+        )
         params = {"limit": limit, "sort": sort, "t": timeframe, "raw_json": 1}
 
         comments = await self.connection.paginate_response(
@@ -168,18 +227,6 @@ class Reddit:
         subreddit = kwargs.get("subreddit")
         username = kwargs.get("username")
 
-        posts_map = {
-            "best": f"{self.connection.endpoints.base}/r/{kind}.json",
-            "controversial": f"{self.connection.endpoints.base}/r/{kind}.json",
-            "front_page": f"{self.connection.endpoints.base}/.json",
-            "new": f"{self.connection.endpoints.base}/new.json",
-            "popular": f"{self.connection.endpoints.base}/r/{kind}.json",
-            "rising": f"{self.connection.endpoints.base}/r/{kind}.json",
-            "subreddit": f"{self.connection.endpoints.subreddit}/{subreddit}.json",
-            "user": f"{self.connection.endpoints.user}/{username}/submitted.json",
-            "search_subreddit": f"{self.connection.endpoints.subreddit}/{subreddit}/search.json?q={query}&restrict_sr=1",
-        }
-
         if status:
             status.update(
                 f"Searching for '{query}' in {limit} posts from {subreddit}"
@@ -187,12 +234,12 @@ class Reddit:
                 else f"Getting {limit} {kind} posts"
             )
 
-        endpoint = posts_map[kind]
+        endpoint = _POSTS_ENDPOINTS[kind].format(subreddit=subreddit, username=username)
 
         params = {"limit": limit, "sort": sort, "t": timeframe, "raw_json": 1}
 
         if kind == "search_subreddit":
-            params = params.update({"q": query, "restrict_sr": 1})
+            params.update({"q": query, "restrict_sr": 1})
 
         posts = await self.connection.paginate_response(
             session=session,
@@ -224,14 +271,7 @@ class Reddit:
         status: Optional[dummies.Status] = None,
     ) -> List[SimpleNamespace]:
 
-        search_map = {
-            "posts": self.connection.endpoints.base,
-            "subreddits": self.connection.endpoints.subreddits,
-            "users": self.connection.endpoints.users,
-        }
-
-        endpoint = search_map[kind]
-        endpoint += f"/search.json"
+        endpoint = _SEARCH_ENDPOINTS[kind]
         params = {"q": query, "limit": limit, "sort": sort, "raw_json": 1}
 
         if kind == "posts":
@@ -277,6 +317,7 @@ class Reddit:
             endpoint=f"{self.connection.endpoints.subreddit}/{name}/about.json",
             proxy=proxy,
             proxy_auth=proxy_auth,
+            cache_ttl=_ABOUT_CACHE_TTL,
         )
         sanitised_response = self._parse.subreddit(response=response)
 
@@ -295,18 +336,10 @@ class Reddit:
         **kwargs: str,
     ) -> Union[List[SimpleNamespace], SimpleNamespace]:
 
-        subreddits_map = {
-            "all": f"{self.connection.endpoints.subreddits}.json",
-            "default": f"{self.connection.endpoints.subreddits}/default.json",
-            "new": f"{self.connection.endpoints.subreddits}/new.json",
-            "popular": f"{self.connection.endpoints.subreddits}/popular.json",
-            "user_moderated": f"{self.connection.endpoints.user}/{kwargs.get('username')}/moderated_subreddits.json",
-        }
-
         if status:
             status.update(f"Getting {limit} {kind} subreddits")
 
-        endpoint = subreddits_map[kind]
+        endpoint = _SUBREDDITS_ENDPOINTS[kind].format(username=kwargs.get("username"))
         params = {"raw_json": 1}
 
         if kind == "user_moderated":
@@ -349,6 +382,7 @@ class Reddit:
             endpoint=f"{self.connection.endpoints.user}/{name}/about.json",
             proxy=proxy,
             proxy_auth=proxy_auth,
+            cache_ttl=_ABOUT_CACHE_TTL,
         )
         sanitised_response = self._parse.user(response=response)
 
@@ -366,16 +400,10 @@ class Reddit:
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
     ) -> List[SimpleNamespace]:
 
-        users_map = {
-            "all": f"{self.connection.endpoints.users}.json",
-            "new": f"{self.connection.endpoints.users}/new.json",
-            "popular": f"{self.connection.endpoints.users}/popular.json",
-        }
-
         if status:
             status.update(f"Getting {limit} {kind} users")
 
-        endpoint = users_map[kind]
+        endpoint = _USERS_ENDPOINTS[kind]
         params = {
             "limit": limit,
             "t": timeframe,